@@ -0,0 +1,98 @@
+import argparse
+import asyncio
+import os
+import time
+from dotenv import load_dotenv
+from rich.console import Console
+from rich.table import Table
+from coordinator import ResearchCoordinator
+from research_agents.query_agent import create_query_agent
+from research_agents.search_agent import create_search_agent, create_batch_search_agent
+from research_agents.follow_up_agent import create_follow_up_agent
+from research_agents.synthesis_agent import create_synthesis_agent
+from llm_config import create_default_config
+from token_utils import get_context_limit
+
+load_dotenv()
+
+console = Console()
+
+# Each variant maps to extra ResearchCoordinator keyword arguments. "phased" is the baseline (per-result
+# summaries, phased flow); "batched" and "pipelined" each change one of those, "batched+pipelined" both
+VARIANTS = {
+    "phased": lambda llm, mode: {"pipelined": False},
+    "batched": lambda llm, mode: {"pipelined": False, "batch_search_agent": create_batch_search_agent(llm, mode)},
+    "pipelined": lambda llm, mode: {"pipelined": True},
+    "batched+pipelined": lambda llm, mode: {"pipelined": True, "batch_search_agent": create_batch_search_agent(llm, mode)},
+}
+
+async def run_variant(name: str, args, llm_config) -> dict:
+    llm = llm_config.main_model
+    coordinator = ResearchCoordinator(
+        args.query,
+        create_query_agent(llm),
+        create_search_agent(llm, args.mode),
+        create_follow_up_agent(llm, args.mode),
+        create_synthesis_agent(llm, args.mode),
+        args.mode,
+        args.search_provider,
+        os.getenv("SERPER_API_KEY"),
+        os.getenv("BRAVE_API_KEY"),
+        context_limit=args.context_window or get_context_limit(args.model),
+        time_budget=args.time_budget,
+        novelty_threshold=args.novelty_threshold,
+        **VARIANTS[name](llm, args.mode)
+    )
+    coordinator.max_speculative_queries = args.speculative_queries
+    start_time = time.time()
+    await coordinator.research()
+    return {
+        "variant": name,
+        "elapsed": time.time() - start_time,
+        "llm_calls": coordinator.llm_calls,
+        "total_tokens": coordinator.total_tokens,
+        "results": len(coordinator.search_results),
+        "speculative_results": coordinator.speculative_results,
+        "queries": coordinator.total_queries,
+    }
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare LLM calls, tokens and latency across TERA research variants.")
+    parser.add_argument("query", nargs="?", default=os.getenv("DEFAULT_QUERY", "What is the capital of France?"))
+    parser.add_argument("--provider", default=os.getenv("MAIN_MODEL_PROVIDER", "xai"))
+    parser.add_argument("--model", default=os.getenv("GROK_MODEL_NORMAL", "grok-3-mini-beta"))
+    parser.add_argument("--mode", choices=["1", "2"], default="2")
+    parser.add_argument("--search-provider", choices=["duckduckgo", "serper", "brave"], default="duckduckgo")
+    parser.add_argument("--context-window", type=int, default=int(os.getenv("CONTEXT_WINDOW")) if os.getenv("CONTEXT_WINDOW") else None, help="Override the model's context window in tokens")
+    parser.add_argument("--time-budget", type=float, default=None, help="Wall-clock budget in seconds for each run")
+    parser.add_argument("--novelty-threshold", type=float, default=0.3, help="Minimum novelty for deep mode to keep iterating")
+    parser.add_argument("--speculative-queries", type=int, default=1, help="Speculative follow-up queries per iteration in pipelined runs (0 disables speculation)")
+    parser.add_argument("--variants", nargs="+", choices=list(VARIANTS), default=list(VARIANTS))
+    args = parser.parse_args()
+
+    if args.mode == "1" and {"pipelined", "batched+pipelined"} & set(args.variants):
+        console.print("[bold yellow]Warning:[/bold yellow] normal mode always uses the phased flow, so pipelined variants run the same code path as their phased counterparts. Use --mode 2 to compare them.")
+
+    llm_config = create_default_config(args.provider, args.model)
+    rows = []
+    for name in args.variants:
+        console.print(f"\n[bold magenta]══════ Benchmark variant: {name} ══════[/bold magenta]")
+        rows.append(await run_variant(name, args, llm_config))
+
+    table = Table(title=f"Benchmark ({'Normal' if args.mode == '1' else 'Deep'} mode, {args.model})")
+    table.add_column("Variant", style="bold white")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Results", justify="right")
+    table.add_column("Speculative", justify="right")
+    table.add_column("Queries", justify="right")
+    table.add_column("s/result", justify="right")
+    table.add_column("LLM calls", justify="right")
+    table.add_column("Total tokens", justify="right")
+    for row in rows:
+        seconds_per_result = f"{row['elapsed'] / row['results']:.2f}" if row["results"] else "-"
+        table.add_row(row["variant"], f"{row['elapsed']:.2f}", str(row["results"]), str(row["speculative_results"]), str(row["queries"]), seconds_per_result, str(row["llm_calls"]), str(row["total_tokens"]))
+    console.print(table)
+    console.print("[dim]Runs that analyze different numbers of results are not directly comparable; compare s/result, or pass --speculative-queries 0 for a like-for-like latency comparison.[/dim]")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,4 +1,6 @@
+import asyncio
 import time
+from typing import Optional
 import requests
 from agents import Runner
 from duckduckgo_search import DDGS
@@ -7,11 +9,25 @@ from rich.panel import Panel
 from rich.markdown import Markdown
 from models import SearchResult
 from research_agents.follow_up_agent import FollowUpDecisionResponse
+from research_agents.search_agent import html_to_text
+from fetcher import PageFetcher
+from deadline import DeadlineScheduler
+from novelty import novelty_score, salient_terms
+from token_utils import estimate_tokens, compress_text, pack_texts, DEFAULT_CONTEXT_LIMIT
 
 console = Console()
 
+# Estimated tokens per page in a batched summarization request, on top of the page text itself
+BATCH_PAGE_HEADER_TOKENS = 50
+BATCH_SUMMARY_TOKENS_NORMAL = 350
+BATCH_SUMMARY_TOKENS_DEEP = 650
+
+# Connect and read timeouts for search provider requests. Searches run in worker threads, and a deadline
+# cancellation only stops waiting on them, so these timeouts are what actually bound a straggling search.
+SEARCH_TIMEOUT = (5, 10)
+
 class ResearchCoordinator:
-    def __init__(self, query: str, query_agent, search_agent, follow_up_decision_agent, synthesis_agent, mode: str, search_provider: str, serper_api_key: str, brave_api_key: str):
+    def __init__(self, query: str, query_agent, search_agent, follow_up_decision_agent, synthesis_agent, mode: str, search_provider: str, serper_api_key: str, brave_api_key: str, batch_search_agent=None, batch_token_budget: int = 12000, context_limit: int = DEFAULT_CONTEXT_LIMIT, time_budget: Optional[float] = None, novelty_threshold: float = 0.3, fetcher: Optional[PageFetcher] = None, pipelined: bool = True):
         self.query = query
         self.search_results = []
         self.iteration = 1
@@ -25,9 +41,36 @@ class ResearchCoordinator:
         self.synthesis_agent = synthesis_agent
         self.serper_api_key = serper_api_key
         self.brave_api_key = brave_api_key
+        self.batch_search_agent = batch_search_agent  # Summarize several pages per call when set
+        self.batch_token_budget = batch_token_budget  # Max estimated page tokens packed into one batch
+        self.context_limit = context_limit  # Context window of the model, in tokens
+        self.output_token_reserve = min(4096 if mode == "1" else 8192, context_limit // 4)  # Room left for the model's answer
+        self.scheduler = DeadlineScheduler(time_budget)  # Schedules stages against an optional wall-clock budget
+        self.novelty_threshold = novelty_threshold  # Stop deep iterations once new findings add less than this
+        self.fetcher = fetcher or PageFetcher()  # Pooled, per-host limited page fetching for whole rounds
+        self.pipelined = pipelined  # Deep mode streams search -> fetch -> summarize and speculates on follow-ups
+        self.pipeline_queue_size = 8  # Bound on items waiting between pipeline stages
+        self.fetch_workers = 4
+        self.summarize_workers = 3
+        self.batch_wait = 5.0  # Seconds a pipelined batch waits for more pages before it is sent
+        self.max_speculative_queries = 1
+        self.speculative_results = 0  # Results from speculative follow-up searches that were kept and analyzed
+        self.analyses_started = 0  # The first analysis of a run always goes ahead, even past the deadline
+        self.llm_calls = 0  # Track LLM requests made across all agents
+        self.total_tokens = 0  # Track tokens consumed across all agents
 
     async def research(self) -> str:
+        try:
+            return await self.run_research()
+        finally:
+            await self.fetcher.close()
+
+    async def run_research(self) -> str:
+        self.scheduler.start()
+        # Query generation is never cut, there is nothing to research without it
+        start_time = time.time()
         query_response = await self.generate_queries()
+        self.scheduler.observe("query", time.time() - start_time)
         await self.perform_research_for_queries(queries=query_response.queries)
 
         # In normal mode, no follow-up iterations; in deep mode, allow more iterations
@@ -36,21 +79,61 @@ class ResearchCoordinator:
             console.print("[cyan]Normal mode: No follow-up iterations allowed.[/cyan]")
         else:
             while self.iteration < max_iterations and self.follow_up_decision_agent:
-                decision_response = await self.generate_followup()
-                if not decision_response.should_follow_up:
-                    console.print("[cyan]No more research needed. Synthesizing report...[/cyan]")
+                if not self.scheduler.can_afford("followup", "search", "analysis"):
+                    self.scheduler.cut(f"Stopped after iteration {self.iteration}: not enough time left for another follow-up round.")
                     break
-                self.iteration += 1
-                console.print(f"[cyan]Conducting follow-up research (iteration {self.iteration})...[/cyan]")
-                await self.perform_research_for_queries(queries=decision_response.queries)
+                # Keep the network busy with likely follow-up searches while the agent decides
+                speculation = asyncio.create_task(self.speculate_followup()) if self.pipelined else None
+                try:
+                    try:
+                        decision_response = await self.scheduler.run(self.generate_followup(), "followup")
+                    except asyncio.TimeoutError:
+                        self.scheduler.cut(f"Cancelled the follow-up decision after iteration {self.iteration}.")
+                        break
+                    if not decision_response.should_follow_up:
+                        console.print("[cyan]No more research needed. Synthesizing report...[/cyan]")
+                        break
+                    self.iteration += 1
+                    console.print(f"[cyan]Conducting follow-up research (iteration {self.iteration})...[/cyan]")
+                    previous_count = len(self.search_results)
+                    prefetched = []
+                    if speculation:
+                        try:
+                            speculative_queries, prefetched = await self.scheduler.run(speculation, "fetch")
+                            speculation = None
+                            # Speculative queries only count once their results are actually used
+                            self.total_queries += len(speculative_queries)
+                            self.speculative_results += len(prefetched)
+                        except asyncio.TimeoutError:
+                            speculation = None
+                            self.scheduler.cut(f"Dropped speculative follow-up results for iteration {self.iteration}.")
+                    await self.perform_research_for_queries(queries=decision_response.queries, prefetched=prefetched)
+                    novelty = novelty_score(
+                        [result.summary for result in self.search_results[previous_count:]],
+                        [result.summary for result in self.search_results[:previous_count]]
+                    )
+                    console.print(f"[dim]Novelty of iteration {self.iteration}: {novelty:.2f} (threshold {self.novelty_threshold:.2f})[/dim]")
+                    if novelty < self.novelty_threshold:
+                        console.print("[cyan]New sources mostly repeat existing findings. Synthesizing report...[/cyan]")
+                        break
+                finally:
+                    # Any exit that didn't consume the speculative searches must stop them before the fetcher closes
+                    await self.discard_speculation(speculation)
 
-        final_report = await self.synthesis_report()
-        console.print(f"\n[bold green]✓ Research complete![/bold green] Processed {self.total_queries} queries across {self.iteration} iteration(s), with {len(self.search_results)} total results.\n")
+        final_report = await self.synthesis_report() + self.scheduler.report_notes()
+        console.print(f"\n[bold green]✓ Research complete![/bold green] Processed {self.total_queries} queries across {self.iteration} iteration(s), with {len(self.search_results)} total results ({self.llm_calls} LLM calls, {self.total_tokens} tokens).\n")
         return final_report
 
+    async def run_agent(self, agent, input: str):
+        result = await Runner.run(agent, input=input)
+        usage = result.context_wrapper.usage
+        self.llm_calls += usage.requests
+        self.total_tokens += usage.total_tokens
+        return result
+
     async def generate_queries(self):
         with console.status("[bold cyan]Analyzing query...[/bold cyan]") as status:
-            result = await Runner.run(self.query_agent, input=self.query)
+            result = await self.run_agent(self.query_agent, input=self.query)
             console.print(Panel(f"[bold cyan]Query Analysis[/bold cyan]"))
             console.print(f"[yellow]Thoughts:[/yellow] {result.final_output.thoughts}")
             console.print("\n[yellow]Generated Search Queries:[/yellow]")
@@ -69,7 +152,7 @@ class ResearchCoordinator:
         try:
             if self.search_provider == "duckduckgo":
                 max_results = 2 if self.mode == "1" else 5
-                results = DDGS().text(query, region='us-en', safesearch='on', timelimit='y', max_results=max_results)
+                results = DDGS(timeout=SEARCH_TIMEOUT[1]).text(query, region='us-en', safesearch='on', timelimit='y', max_results=max_results)
                 results = [{"title": r["title"], "href": r["href"]} for r in results]
                 return results[:max_results]  # Strictly enforce the max_results limit
             elif self.search_provider == "serper":
@@ -78,7 +161,8 @@ class ResearchCoordinator:
                 response = requests.post(
                     "https://google.serper.dev/search",
                     json={"q": query, "num": max_results},
-                    headers=headers
+                    headers=headers,
+                    timeout=SEARCH_TIMEOUT
                 )
                 response.raise_for_status()
                 results = response.json().get("organic", [])
@@ -91,7 +175,8 @@ class ResearchCoordinator:
                 response = requests.get(
                     "https://api.search.brave.com/res/v1/web/search",
                     headers=headers,
-                    params=params
+                    params=params,
+                    timeout=SEARCH_TIMEOUT
                 )
                 response.raise_for_status()
                 results = response.json().get("web", {}).get("results", [])
@@ -103,19 +188,31 @@ class ResearchCoordinator:
             console.print(f"[bold red]Search error ({self.search_provider}):[/bold red] {str(ex)}")
             return []
 
-    async def perform_research_for_queries(self, queries: list[str]) -> None:
+    async def perform_research_for_queries(self, queries: list[str], prefetched: Optional[list[tuple[dict, Optional[str]]]] = None) -> None:
+        if self.pipelined and self.mode == "2":
+            await self.perform_research_pipelined(queries, prefetched or [])
+            return
         all_search_results = {}
         max_total_results = 6 if self.mode == "1" else float('inf')  # No cap in deep mode
 
-        for query in queries:
+        for i, query in enumerate(queries):
             if self.mode == "1" and self.total_queries >= 5:
                 console.print("[cyan]Normal mode query limit (5) reached. Skipping further queries...[/cyan]")
                 break
+            first_search = self.total_queries == 0
+            if not first_search and not self.scheduler.can_afford("search", "analysis"):
+                self.scheduler.cut(f"Skipped {len(queries) - i} search quer{'y' if len(queries) - i == 1 else 'ies'} in iteration {self.iteration}.")
+                break
             self.total_queries += 1
-            search_results = self.search(query)
+            try:
+                search_results = await self.scheduler.run(asyncio.to_thread(self.search, query), "search", guaranteed=first_search)
+            except asyncio.TimeoutError:
+                self.scheduler.cut(f"Cancelled straggling search for '{query}'.")
+                continue
             all_search_results[query] = search_results
             console.print(f"[cyan]Using {self.search_provider} for query: {query}[/cyan]")
 
+        pending_results = []
         for query, results in all_search_results.items():
             console.print(f"\n[bold cyan]Searching for (via {self.search_provider}):[/bold cyan] {query}")
             for result in results:
@@ -125,64 +222,321 @@ class ResearchCoordinator:
                 self.total_results += 1
                 console.print(f"  [green]Result:[/green] {result['title']}")
                 console.print(f"  [dim]URL:[/dim] {result['href']}")
-                console.print(f"  [cyan]Analyzing content...[/cyan]")
-                start_analysis_time = time.time()
-                search_input = f"Title: {result['title']}\nURL: {result['href']}"
-                agent_result = await Runner.run(self.search_agent, input=search_input)
-                analysis_time = time.time() - start_analysis_time
-                search_result = SearchResult(
-                    title=result['title'],
-                    url=result['href'],
-                    summary=agent_result.final_output
-                )
-                self.search_results.append(search_result)
-                summary_preview = agent_result.final_output[:100] + ("..." if len(agent_result.final_output) > 100 else "")
-                console.print(f"  [green]Summary:[/green] {summary_preview}")
-                console.print(f"  [dim]Analysis completed in {analysis_time:.2f}s[/dim]\n")
+                pending_results.append(result)
+
+        pages = await self.fetch_pages(pending_results)
+        if self.batch_search_agent:
+            await self.summarize_batched(pending_results, pages)
+        else:
+            await self.summarize_results(pending_results, pages)
+        console.print(f"\n[bold green]✓ Research round complete![/bold green] Found {len(self.search_results)} total results in this iteration with {len(queries)} queries.")
+
+    async def perform_research_pipelined(self, queries: list[str], prefetched: list[tuple[dict, Optional[str]]]) -> None:
+        # Stream results through bounded queues so early analyses overlap with later searches and fetches
+        fetch_queue = asyncio.Queue(maxsize=self.pipeline_queue_size)
+        summarize_queue = asyncio.Queue(maxsize=self.pipeline_queue_size)
+        seen_urls = {result.url for result in self.search_results}
+        seen_urls.update(result['href'] for result, _ in prefetched)
+        skipped = []
+
+        async def search_stage() -> None:
+            for i, query in enumerate(queries):
+                first_search = self.total_queries == 0
+                if not first_search and not self.scheduler.can_afford("search", "analysis"):
+                    self.scheduler.cut(f"Skipped {len(queries) - i} search quer{'y' if len(queries) - i == 1 else 'ies'} in iteration {self.iteration}.")
+                    break
+                self.total_queries += 1
+                try:
+                    results = await self.scheduler.run(asyncio.to_thread(self.search, query), "search", guaranteed=first_search)
+                except asyncio.TimeoutError:
+                    self.scheduler.cut(f"Cancelled straggling search for '{query}'.")
+                    continue
+                console.print(f"\n[bold cyan]Searching for (via {self.search_provider}):[/bold cyan] {query}")
+                for result in results:
+                    if result['href'] in seen_urls:
+                        continue
+                    seen_urls.add(result['href'])
+                    self.total_results += 1
+                    console.print(f"  [green]Result:[/green] {result['title']}")
+                    console.print(f"  [dim]URL:[/dim] {result['href']}")
+                    await fetch_queue.put(result)
+
+        async def prefetched_stage() -> None:
+            # Results from speculative follow-up searches were fetched while the decision was pending
+            for result, content in prefetched:
+                self.total_results += 1
+                await summarize_queue.put((result, content))
+
+        async def fetch_worker() -> None:
+            while True:
+                result = await fetch_queue.get()
+                if result is None:
+                    return
+                content = None
+                try:
+                    fetch_result = await self.scheduler.run(self.fetcher.fetch(result['href']), "fetch", guaranteed=self.analyses_started == 0)
+                    if fetch_result.ok:
+                        content = await asyncio.to_thread(html_to_text, fetch_result.text) or None
+                    else:
+                        console.print(f"  [dim]Could not fetch {result['href']}: {fetch_result.error}[/dim]")
+                except asyncio.TimeoutError:
+                    pass  # The search agent scrapes the page itself if there is still time
+                await summarize_queue.put((result, content))
+
+        def batch_weight(item) -> int:
+            # Pages without content go to the per-result fallback and take no room in the batch
+            return estimate_tokens(item[1]) + self.batch_page_overhead() if item[1] else 0
+
+        async def summarize_worker() -> None:
+            carry = None  # An item that did not fit the previous batch opens the next one
+            while True:
+                item = carry if carry is not None else await summarize_queue.get()
+                carry = None
+                if item is None:
+                    return
+                batch = [item]
+                if self.batch_search_agent:
+                    # Keep the batch open until it fills the token budget, upstream finishes, or the wait window closes
+                    budget = self.batch_packing_budget()
+                    tokens = batch_weight(item)
+                    window_end = time.time() + self.batch_wait
+                    while tokens < budget:
+                        try:
+                            next_item = await asyncio.wait_for(summarize_queue.get(), timeout=max(window_end - time.time(), 0.0))
+                        except asyncio.TimeoutError:
+                            break
+                        if next_item is None:
+                            summarize_queue.put_nowait(None)
+                            break
+                        if tokens + batch_weight(next_item) > budget:
+                            carry = next_item
+                            break
+                        batch.append(next_item)
+                        tokens += batch_weight(next_item)
+                stage = "batch" if self.batch_search_agent else "analysis"
+                if self.analyses_started:
+                    if summarize_workers > 1:
+                        # Judge against a real latency rather than the default guess while the first analysis runs
+                        await self.scheduler.wait_observed(stage)
+                    if not self.scheduler.can_afford(stage, concurrency=summarize_workers):
+                        skipped.extend(batch)
+                        continue
+                if self.batch_search_agent:
+                    await self.summarize_batched([result for result, _ in batch], {result['href']: content for result, content in batch if content})
+                else:
+                    await self.summarize_result(item[0], item[1])
+
+        async def run_stage(workers: list, next_queue: asyncio.Queue, next_workers: int) -> None:
+            await asyncio.gather(*workers)
+            for _ in range(next_workers):
+                await next_queue.put(None)
+
+        # A single batching worker lets pages pile up into full batches while it waits on the model
+        summarize_workers = 1 if self.batch_search_agent else self.summarize_workers
+        stages = [
+            asyncio.create_task(run_stage([search_stage()], fetch_queue, self.fetch_workers)),
+            asyncio.create_task(run_stage([prefetched_stage()] + [fetch_worker() for _ in range(self.fetch_workers)], summarize_queue, summarize_workers)),
+            *(asyncio.create_task(summarize_worker()) for _ in range(summarize_workers))
+        ]
+        try:
+            await asyncio.gather(*stages)
+        except BaseException:
+            # A failed stage would leave its neighbours blocked on the bounded queues, so stop them all
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            raise
+        if skipped:
+            self.scheduler.cut(f"Skipped analysis of {len(skipped)} result(s) in iteration {self.iteration}.")
         console.print(f"\n[bold green]✓ Research round complete![/bold green] Found {len(self.search_results)} total results in this iteration with {len(queries)} queries.")
 
+    async def speculate_followup(self) -> tuple[list[str], list[tuple[dict, Optional[str]]]]:
+        # Search and fetch likely follow-up topics without any LLM calls; results are only used if the agent continues
+        terms = salient_terms([result.summary for result in self.search_results], exclude_text=self.query, limit=2 * self.max_speculative_queries)
+        queries = [f"{self.query} {' '.join(terms[i:i + 2])}" for i in range(0, len(terms), 2)]
+        prefetched = []
+        seen_urls = {result.url for result in self.search_results}
+        for query in queries:
+            console.print(f"[dim]Speculatively searching: {query}[/dim]")
+            for result in await asyncio.to_thread(self.search, query):
+                if result['href'] not in seen_urls:
+                    seen_urls.add(result['href'])
+                    prefetched.append(result)
+        fetched = await self.fetcher.fetch_many([result['href'] for result in prefetched])
+        pages = []
+        for result in prefetched:
+            fetch_result = fetched[result['href']]
+            content = await asyncio.to_thread(html_to_text, fetch_result.text) if fetch_result.ok else None
+            pages.append((result, content or None))
+        return queries, pages
+
+    async def discard_speculation(self, speculation: Optional[asyncio.Task]) -> None:
+        if speculation is None:
+            return
+        speculation.cancel()
+        try:
+            await speculation
+        except (asyncio.CancelledError, Exception):
+            pass  # Its results are dropped either way, don't let a failed speculation mask the real exit
+        console.print("[dim]Discarded speculative follow-up searches.[/dim]")
+
+    async def fetch_pages(self, results: list[dict]) -> dict[str, str]:
+        # Fetch the whole round at once; pages that fail are left for the search agent to scrape itself
+        if not results:
+            return {}
+        try:
+            with console.status(f"[bold cyan]Fetching {len(results)} page(s)...[/bold cyan]"):
+                fetched = await self.scheduler.run(self.fetcher.fetch_many([result['href'] for result in results]), "fetch", guaranteed=self.analyses_started == 0)
+        except asyncio.TimeoutError:
+            self.scheduler.cut(f"Cancelled page fetching for {len(results)} result(s) in iteration {self.iteration}.")
+            return {}
+        pages = {}
+        for url, fetch_result in fetched.items():
+            if not fetch_result.ok:
+                console.print(f"  [dim]Could not fetch {url}: {fetch_result.error}[/dim]")
+                continue
+            text = await asyncio.to_thread(html_to_text, fetch_result.text)
+            if text:
+                pages[url] = text
+        console.print(f"  [dim]Fetched {len(pages)}/{len(results)} page(s)[/dim]")
+        return pages
+
+    async def summarize_results(self, results: list[dict], pages: dict[str, str]) -> None:
+        for i, result in enumerate(results):
+            if self.analyses_started and not self.scheduler.can_afford("analysis"):
+                self.scheduler.cut(f"Skipped analysis of {len(results) - i} result(s) in iteration {self.iteration}.")
+                break
+            await self.summarize_result(result, pages.get(result['href']))
+
+    async def summarize_result(self, result: dict, content: Optional[str] = None) -> None:
+        console.print(f"  [cyan]Analyzing content:[/cyan] {result['title']}")
+        start_analysis_time = time.time()
+        search_input = f"Title: {result['title']}\nURL: {result['href']}"
+        if content:
+            search_input += f"\nContent: {content}"
+        try:
+            guaranteed = self.analyses_started == 0
+            self.analyses_started += 1
+            agent_result = await self.scheduler.run(self.run_agent(self.search_agent, input=search_input), "analysis", guaranteed=guaranteed)
+        except asyncio.TimeoutError:
+            self.scheduler.cut(f"Cancelled straggling analysis of '{result['title']}'.")
+            return
+        analysis_time = time.time() - start_analysis_time
+        self.add_search_result(result, agent_result.final_output)
+        console.print(f"  [dim]Analysis completed in {analysis_time:.2f}s[/dim]\n")
+
+    def add_search_result(self, result: dict, summary: str) -> None:
+        self.search_results.append(SearchResult(title=result['title'], url=result['href'], summary=summary))
+        summary_preview = summary[:100] + ("..." if len(summary) > 100 else "")
+        console.print(f"  [green]Summary:[/green] {summary_preview}")
+
+    async def summarize_batched(self, results: list[dict], pages: dict[str, str]) -> None:
+        # Pages that could not be fetched are summarized one at a time by the search agent
+        fallback_results = [result for result in results if result['href'] not in pages]
+        extracted = [(result, pages[result['href']]) for result in results if result['href'] in pages]
+        batches = [
+            [extracted[i] for i in group]
+            for group in pack_texts([page for _, page in extracted], self.batch_packing_budget(), self.batch_page_overhead())
+        ]
+
+        summaries = {}
+        for batch_index, batch in enumerate(batches, 1):
+            if self.analyses_started and not self.scheduler.can_afford("batch"):
+                self.scheduler.cut(f"Skipped {len(batches) - batch_index + 1} summarization batch(es) in iteration {self.iteration}.")
+                break
+            console.print(f"  [cyan]Analyzing batch {batch_index}/{len(batches)} ({len(batch)} pages)...[/cyan]")
+            start_analysis_time = time.time()
+            batch_input = f"Mode: {self.mode}\n"
+            for i, (result, page) in enumerate(batch, 1):
+                batch_input += f"\nPage {i}:\nTitle: {result['title']}\nURL: {result['href']}\nContent: {page}\n"
+            guaranteed = self.analyses_started == 0
+            self.analyses_started += 1
+            try:
+                agent_result = await self.scheduler.run(self.run_agent(self.batch_search_agent, input=batch_input), "batch", guaranteed=guaranteed)
+            except asyncio.TimeoutError:
+                self.scheduler.cut(f"Cancelled straggling summarization batch {batch_index} ({len(batch)} pages).")
+                continue
+            except Exception as ex:
+                console.print(f"[bold red]Batch summarization error:[/bold red] {str(ex)}")
+            else:
+                batch_urls = {result['href'].strip().rstrip('/'): result for result, _ in batch}
+                for page_summary in agent_result.final_output.summaries:
+                    if not page_summary.summary.strip():
+                        continue
+                    # Map by page position; the echoed URL only overrides it when it names another page exactly
+                    result = batch[page_summary.page - 1][0] if 1 <= page_summary.page <= len(batch) else None
+                    echoed_url = page_summary.url.strip().rstrip('/')
+                    if echoed_url in batch_urls and (result is None or result['href'].strip().rstrip('/') != echoed_url):
+                        result = batch_urls[echoed_url]
+                    if result is not None:
+                        summaries[result['href']] = page_summary.summary
+                console.print(f"  [dim]Batch analysis completed in {time.time() - start_analysis_time:.2f}s[/dim]")
+            # Pages missing from a failed or truncated batch are summarized one at a time
+            fallback_results.extend(result for result, _ in batch if result['href'] not in summaries)
+
+        for result in results:
+            if result['href'] in summaries:
+                console.print(f"\n  [green]Result:[/green] {result['title']}")
+                self.add_search_result(result, summaries[result['href']])
+        if fallback_results:
+            console.print(f"\n[yellow]Falling back to per-result analysis for {len(fallback_results)} page(s)...[/yellow]")
+            await self.summarize_results(fallback_results, pages)
+
+    def input_token_budget(self, agent, output_tokens: Optional[int] = None) -> int:
+        instructions = getattr(agent, "instructions", "")
+        output_tokens = self.output_token_reserve if output_tokens is None else output_tokens
+        return self.context_limit - estimate_tokens(instructions if isinstance(instructions, str) else "") - output_tokens
+
+    def batch_page_overhead(self) -> int:
+        # Each batched page also costs its header lines and its summary in the output (4-5 paragraphs in deep mode)
+        return BATCH_PAGE_HEADER_TOKENS + (BATCH_SUMMARY_TOKENS_DEEP if self.mode == "2" else BATCH_SUMMARY_TOKENS_NORMAL)
+
+    def batch_packing_budget(self) -> int:
+        # Never pack past the model's context; output room is charged per page through batch_page_overhead
+        return min(self.batch_token_budget, self.input_token_budget(self.batch_search_agent, output_tokens=0))
+
+    def format_result(self, index: int, result: SearchResult, max_summary_tokens: int) -> str:
+        summary = compress_text(result.summary, max_summary_tokens)
+        return f"\n{index}. Title: {result.title}\n   URL: {result.url}\n   Summary: {summary}\n"
+
     async def synthesis_report(self) -> str:
         with console.status("[bold cyan]Synthesizing research findings...[/bold cyan]") as status:
-            if self.mode == "1" or len(self.search_results) <= 15:
-                # For normal mode or small result sets, synthesize all at once
-                findings_text = f"Query: {self.query}\n\nSearch Results:\n"
-                for i, result in enumerate(self.search_results, 1):
-                    findings_text += f"\n{i}. Title: {result.title}\n   URL: {result.url}\n   Summary: {result.summary}\n"
-                result = await Runner.run(self.synthesis_agent, input=findings_text)
+            header = f"Query: {self.query}\n\nSearch Results:\n"
+            budget = self.input_token_budget(self.synthesis_agent) - estimate_tokens(header)
+            # No single summary may take more than a quarter of a call, so packing stays balanced
+            entries = [self.format_result(i, result, budget // 4) for i, result in enumerate(self.search_results, 1)]
+            groups = pack_texts(entries, budget)
+            if len(groups) <= 1:
+                # Everything fits in the model's context, synthesize all at once
+                result = await self.run_agent(self.synthesis_agent, input=header + "".join(entries))
                 return result.final_output
-            else:
-                # For deep mode with large result sets, chunk the results
-                chunk_size = 15
-                partial_reports = []
-                for i in range(0, len(self.search_results), chunk_size):
-                    chunk = self.search_results[i:i + chunk_size]
-                    findings_text = f"Query: {self.query}\n\nSearch Results:\n"
-                    for j, result in enumerate(chunk, 1):
-                        findings_text += f"\n{j}. Title: {result.title}\n   URL: {result.url}\n   Summary: {result.summary}\n"
-                    result = await Runner.run(self.synthesis_agent, input=findings_text)
-                    partial_reports.append(result.final_output)
-                
-                # Combine partial reports into a final report
-                combined_report = f"# Comprehensive Report on {self.query}\n\n"
-                for idx, partial_report in enumerate(partial_reports, 1):
-                    combined_report += f"## Part {idx}\n\n{partial_report}\n\n"
-                
-                # Optional: Add a final synthesis step to summarize the combined report
-                final_synthesis_input = f"Query: {self.query}\n\nPartial Reports:\n"
-                for idx, partial_report in enumerate(partial_reports, 1):
-                    final_synthesis_input += f"\nPart {idx}:\n{partial_report}\n"
-                final_result = await Runner.run(
-                    self.synthesis_agent,
-                    input=final_synthesis_input + "\nSynthesize these partial reports into a cohesive final report, ensuring all sections are covered and the total length meets the deep mode requirements (1000+ words for 16+ results)."
-                )
-                return final_result.final_output
+
+            # Too large for one call: synthesize packed chunks, then combine the partial reports
+            console.print(f"[cyan]Findings exceed the model context ({self.context_limit} tokens); synthesizing in {len(groups)} parts...[/cyan]")
+            partial_reports = []
+            for group in groups:
+                result = await self.run_agent(self.synthesis_agent, input=header + "".join(entries[i] for i in group))
+                partial_reports.append(result.final_output)
+
+            closing_instruction = "\nSynthesize these partial reports into a cohesive final report, ensuring all sections are covered and the total length meets the deep mode requirements (1000+ words for 16+ results)."
+            final_synthesis_input = f"Query: {self.query}\n\nPartial Reports:\n"
+            part_budget = (self.input_token_budget(self.synthesis_agent) - estimate_tokens(final_synthesis_input + closing_instruction)) // len(partial_reports)
+            for idx, partial_report in enumerate(partial_reports, 1):
+                final_synthesis_input += f"\nPart {idx}:\n{compress_text(partial_report, part_budget)}\n"
+            final_result = await self.run_agent(self.synthesis_agent, input=final_synthesis_input + closing_instruction)
+            return final_result.final_output
 
     async def generate_followup(self) -> FollowUpDecisionResponse:
         with console.status("[bold cyan]Evaluating if more research is needed...[/bold cyan]") as status:
             findings_text = f"Original Query: {self.query}\n\nCurrent Findings:\n"
+            budget = self.input_token_budget(self.follow_up_decision_agent) - estimate_tokens(findings_text)
+            max_summary_tokens = budget
+            if sum(estimate_tokens(result.summary) for result in self.search_results) > budget:
+                # Share the budget evenly across findings when they would overflow the context
+                max_summary_tokens = max(budget // len(self.search_results) - 50, 50)
             for i, result in enumerate(self.search_results, 1):
-                findings_text += f"\n{i}. Title: {result.title}\n   URL: {result.url}\n   Summary: {result.summary}\n"
-            result = await Runner.run(self.follow_up_decision_agent, input=findings_text)
+                findings_text += self.format_result(i, result, max_summary_tokens)
+            result = await self.run_agent(self.follow_up_decision_agent, input=findings_text)
             console.print(Panel(f"[bold cyan]Follow-up Decision[/bold cyan]"))
             console.print(f"[yellow]Decision:[/yellow] {'More research needed' if result.final_output.should_follow_up else 'Research complete'}")
             console.print(f"[yellow]Reasoning:[/yellow] {result.final_output.reasoning}")
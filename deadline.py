@@ -0,0 +1,93 @@
+import asyncio
+import time
+from typing import Optional
+from rich.console import Console
+
+console = Console()
+
+# Starting guesses (in seconds) for each stage, replaced by observed latencies as the run progresses
+DEFAULT_STAGE_LATENCIES = {
+    "query": 5.0,
+    "search": 3.0,
+    "fetch": 5.0,
+    "analysis": 8.0,
+    "batch": 20.0,
+    "followup": 10.0,
+    "synthesis": 20.0,
+}
+LLM_STAGES = ["query", "analysis", "batch", "followup", "synthesis"]
+
+class DeadlineScheduler:
+    def __init__(self, time_budget: Optional[float] = None):
+        self.time_budget = time_budget  # Wall-clock budget in seconds, None for unbounded runs
+        self.deadline = None
+        self.latencies = dict(DEFAULT_STAGE_LATENCIES)
+        self.observed = set()
+        self.observed_events = {}  # Set once a stage's first latency has been observed
+        self.cuts = []  # Human-readable notes about work dropped to meet the deadline
+
+    def start(self) -> None:
+        self.cuts = []
+        self.deadline = time.time() + self.time_budget if self.time_budget else None
+
+    def time_left(self) -> float:
+        if self.deadline is None:
+            return float('inf')
+        return self.deadline - time.time()
+
+    def synthesis_reserve(self) -> float:
+        if "synthesis" in self.observed:
+            return self.latencies["synthesis"]
+        # Synthesis writes far more than any earlier call, so reserve a multiple of the slowest observed LLM stage
+        observed_llm = [self.latencies[stage] for stage in LLM_STAGES if stage in self.observed]
+        if observed_llm:
+            return 3 * max(observed_llm)
+        return self.latencies["synthesis"]
+
+    def time_available(self) -> float:
+        return self.time_left() - self.synthesis_reserve()
+
+    def can_afford(self, *stages: str, concurrency: int = 1) -> bool:
+        # With several workers running a stage side by side, each item only costs a share of its latency
+        return self.time_available() >= sum(self.latencies[stage] for stage in stages) / concurrency
+
+    async def wait_observed(self, stage: str) -> None:
+        if stage not in self.observed:
+            await self.observed_events.setdefault(stage, asyncio.Event()).wait()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        if stage in self.observed:
+            self.latencies[stage] = 0.5 * self.latencies[stage] + 0.5 * seconds
+        else:
+            self.latencies[stage] = seconds
+            self.observed.add(stage)
+            if stage in self.observed_events:
+                self.observed_events[stage].set()
+
+    async def run(self, awaitable, stage: str, guaranteed: bool = False):
+        # Raises asyncio.TimeoutError when the stage would eat into the synthesis reserve.
+        # Guaranteed work (the first search and analysis of a run) is never cut, so a report always has a source.
+        start_time = time.time()
+        if self.deadline is None or guaranteed:
+            result = await awaitable
+        else:
+            try:
+                result = await asyncio.wait_for(awaitable, timeout=max(self.time_available(), 0.0))
+            except asyncio.TimeoutError:
+                # A cancelled straggler only tells us the stage takes at least this long
+                self.observe(stage, max(time.time() - start_time, self.latencies[stage]))
+                raise
+        self.observe(stage, time.time() - start_time)
+        return result
+
+    def cut(self, message: str) -> None:
+        self.cuts.append(message)
+        console.print(f"[yellow]Deadline:[/yellow] {message}")
+
+    def report_notes(self) -> str:
+        if not self.cuts:
+            return ""
+        notes = f"\n\n## Time Budget Notes\n\nThis report was produced within a {self.time_budget:.0f}s time budget. The following work was cut to meet it:\n"
+        for cut in self.cuts:
+            notes += f"- {cut}\n"
+        return notes
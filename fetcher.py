@@ -0,0 +1,131 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib import robotparser
+from urllib.parse import urlsplit
+import aiohttp
+from research_agents.search_agent import USER_AGENT
+
+try:
+    import brotli  # noqa: F401  aiohttp decodes 'br' responses only when Brotli is installed
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+@dataclass
+class FetchResult:
+    url: str
+    final_url: str = ""
+    status: int = 0
+    text: str = ""
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class PageFetcher:
+    def __init__(self, per_host_limit: int = 2, total_limit: int = 20, connect_timeout: float = 5.0, read_timeout: float = 15.0, max_redirects: int = 5, max_bytes: int = 2_000_000, min_host_interval: float = 0.0, respect_robots: bool = False):
+        self.per_host_limit = per_host_limit  # Concurrent requests allowed against a single host
+        self.total_limit = total_limit  # Concurrent requests allowed overall
+        self.timeout = aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+        self.max_redirects = max_redirects
+        self.max_bytes = max_bytes  # Stop reading bodies past this size, page text is truncated later anyway
+        self.min_host_interval = min_host_interval  # Seconds between request starts on the same host
+        self.respect_robots = respect_robots
+        self.session = None
+        self.host_semaphores = {}
+        self.host_locks = {}
+        self.host_last_request = {}
+        self.robots = {}  # Parsed robots.txt per scheme://host, None when missing or unreachable (allow all)
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.total_limit, limit_per_host=self.per_host_limit, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING},
+            )
+        return self.session
+
+    async def close(self) -> None:
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def __aenter__(self):
+        await self.get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def wait_for_turn(self, host: str) -> None:
+        if self.min_host_interval <= 0:
+            return
+        async with self.host_locks.setdefault(host, asyncio.Lock()):
+            wait = self.host_last_request.get(host, 0.0) + self.min_host_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self.host_last_request[host] = time.monotonic()
+
+    async def allowed_by_robots(self, url: str) -> bool:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        async with self.host_locks.setdefault(f"robots:{origin}", asyncio.Lock()):
+            if origin not in self.robots:
+                parser = None
+                try:
+                    session = await self.get_session()
+                    async with session.get(f"{origin}/robots.txt", max_redirects=self.max_redirects) as response:
+                        if response.status == 200:
+                            parser = robotparser.RobotFileParser()
+                            parser.parse((await response.text(errors="replace")).splitlines())
+                        elif response.status in (401, 403):
+                            # Same as RobotFileParser.read(): an access-restricted robots.txt disallows everything
+                            parser = robotparser.RobotFileParser()
+                            parser.disallow_all = True
+                except Exception:
+                    parser = None  # Missing or unreachable robots.txt allows everything
+                self.robots[origin] = parser
+        parser = self.robots[origin]
+        return parser is None or parser.can_fetch(USER_AGENT, url)
+
+    async def fetch(self, url: str) -> FetchResult:
+        host = urlsplit(url).netloc.lower()
+        if not host:
+            return FetchResult(url=url, error="Invalid URL")
+        try:
+            if self.respect_robots and not await self.allowed_by_robots(url):
+                return FetchResult(url=url, error="Disallowed by robots.txt")
+            async with self.host_semaphores.setdefault(host, asyncio.Semaphore(self.per_host_limit)):
+                await self.wait_for_turn(host)
+                session = await self.get_session()
+                async with session.get(url, max_redirects=self.max_redirects) as response:
+                    if response.status >= 400:
+                        return FetchResult(url=url, final_url=str(response.url), status=response.status, error=f"HTTP {response.status}")
+                    content_type = response.headers.get("Content-Type", "")
+                    if content_type and "html" not in content_type and "text" not in content_type:
+                        return FetchResult(url=url, final_url=str(response.url), status=response.status, error=f"Unsupported content type: {content_type}")
+                    # content.read(n) returns after the first buffered chunk, so collect chunks until max_bytes or EOF
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        body.extend(chunk)
+                        if len(body) >= self.max_bytes:
+                            del body[self.max_bytes:]
+                            break
+                    text = body.decode(response.charset or "utf-8", errors="replace")
+                    return FetchResult(url=url, final_url=str(response.url), status=response.status, text=text)
+        except aiohttp.TooManyRedirects:
+            return FetchResult(url=url, error="Too many redirects")
+        except asyncio.TimeoutError:
+            return FetchResult(url=url, error="Timed out")
+        except (aiohttp.ClientError, LookupError, ValueError) as ex:
+            return FetchResult(url=url, error=str(ex) or ex.__class__.__name__)
+
+    async def fetch_many(self, urls: list[str]) -> dict[str, FetchResult]:
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.fetch(url) for url in unique_urls))
+        return dict(zip(unique_urls, results))
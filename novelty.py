@@ -0,0 +1,55 @@
+import re
+
+# Cheap, local information-gain estimate based on content-word overlap (no LLM call needed)
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    "about", "above", "after", "again", "also", "among", "because", "been", "before", "being", "between",
+    "both", "could", "does", "doing", "during", "each", "from", "further", "have", "having", "here", "into",
+    "just", "like", "many", "more", "most", "much", "only", "other", "over", "same", "should", "some", "such",
+    "than", "that", "their", "them", "then", "there", "these", "they", "this", "those", "through", "under",
+    "until", "very", "were", "what", "when", "where", "which", "while", "will", "with", "would", "your",
+    "the", "and", "for", "are", "was", "its", "not", "but", "can", "has", "how", "who", "all", "any", "our",
+    "generally", "often", "typically", "usually", "using", "made",
+}
+
+def content_words(text: str) -> list[str]:
+    # Lowercased content words with stopwords dropped; plurals and word endings are folded by a crude
+    # 6-character prefix stem so "electricity"/"electric" or "cells"/"cell" count as the same term
+    words = []
+    for word in WORD_PATTERN.findall(text.lower()):
+        if len(word) <= 2 or word.isdigit() or word in STOPWORDS:
+            continue
+        if word.endswith("s") and len(word) > 3:
+            word = word[:-1]
+        words.append(word[:6])
+    return words
+
+def novelty_score(new_texts: list[str], existing_texts: list[str]) -> float:
+    # Mean share of each new text's content words (weighted by frequency) not already seen in the existing
+    # texts, 1.0 = entirely new. Word-level overlap still catches paraphrases of the same facts.
+    if not new_texts:
+        return 0.0
+    seen = set()
+    for text in existing_texts:
+        seen.update(content_words(text))
+    scores = []
+    for text in new_texts:
+        words = content_words(text)
+        if words:
+            scores.append(sum(1 for word in words if word not in seen) / len(words))
+    return sum(scores) / len(scores) if scores else 0.0
+
+def salient_terms(texts: list[str], exclude_text: str = "", limit: int = 4) -> list[str]:
+    # Terms that recur often and across several texts, skipping stopwords and anything already in exclude_text
+    excluded = set(WORD_PATTERN.findall(exclude_text.lower()))
+    term_counts = {}
+    document_counts = {}
+    for text in texts:
+        words = [word for word in WORD_PATTERN.findall(text.lower()) if len(word) > 3 and not word.isdigit() and word not in STOPWORDS and word not in excluded]
+        for word in words:
+            term_counts[word] = term_counts.get(word, 0) + 1
+        for word in set(words):
+            document_counts[word] = document_counts.get(word, 0) + 1
+    scores = {word: count * document_counts[word] for word, count in term_counts.items() if document_counts[word] > 1}
+    return sorted(scores, key=scores.get, reverse=True)[:limit]
@@ -1,29 +1,38 @@
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
+from pydantic import BaseModel
 import requests
 from agents import Agent, Runner, OpenAIChatCompletionsModel, function_tool
 
 load_dotenv()
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+def html_to_text(html: str) -> str:
+    try:
+        soup = BeautifulSoup(html, 'html.parser')
+        for script in soup(["script", "style"]):
+            script.extract()
+        text = soup.get_text(separator=' ', strip=True)
+        lines = (line.strip() for line in text.splitlines())
+        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        text = ' '.join(chunk for chunk in chunks if chunk)
+        return text[:5000] if len(text) > 5000 else text
+    except ImportError:
+        return html[:5000]
+
+def extract_page_text(url: str) -> str:
+    headers = {
+        'User-Agent': USER_AGENT
+    }
+    response = requests.get(url, headers=headers, timeout=10)
+    response.raise_for_status()
+    return html_to_text(response.text)
+
 @function_tool
 def url_scrape(url: str) -> str:
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        try:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            for script in soup(["script", "style"]):
-                script.extract()
-            text = soup.get_text(separator=' ', strip=True)
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-            return text[:5000] if len(text) > 5000 else text
-        except ImportError:
-            return response.text[:5000]
+        return extract_page_text(url)
     except Exception as e:
         return f"Failed to scrape content from {url}: {str(e)}"
 
@@ -33,13 +42,46 @@ You are a research assistant. Given a URL and its title, you will analyze the co
 - In normal mode (mode='1'), produce a summary of 2-3 paragraphs.
 - In deep mode (mode='2'), produce a detailed summary of 4-5 paragraphs, capturing more depth, nuances, and specific details.
 
+If the page content is already provided after 'Content:', summarize it directly instead of calling url_scrape. Otherwise, use url_scrape to fetch the page.
+
 Capture the main points. Write succinctly, no need to have complete sentences or perfect grammar. This will be consumed by someone synthesizing a report, so it's vital you capture the essence and ignore any fluff. Do not include any additional commentary other than the summary itself.
 """
 
+BATCH_SEARCH_AGENT_PROMPT = """
+You are a research assistant. You will be given several web pages at once, each in the format 'Page N:', 'Title: ...', 'URL: ...', 'Content: ...'. The page content has already been extracted for you. For EACH page, produce a concise summary of its information. The summary length depends on the research mode:
+
+- In normal mode (mode='1'), produce a summary of 2-3 paragraphs per page.
+- In deep mode (mode='2'), produce a detailed summary of 4-5 paragraphs per page, capturing more depth, nuances, and specific details.
+
+Capture the main points. Write succinctly, no need to have complete sentences or perfect grammar. This will be consumed by someone synthesizing a report, so it's vital you capture the essence and ignore any fluff.
+
+### Output:
+- Return one entry per page in `summaries`, in the same order as the input.
+- Set `page` to the page's number N from its 'Page N:' header.
+- Copy each page's URL exactly as given into the `url` field.
+- Summarize each page only from its own content; do not merge information across pages.
+"""
+
+class PageSummary(BaseModel):
+    page: int
+    url: str
+    summary: str
+
+class BatchSummaryResponse(BaseModel):
+    summaries: list[PageSummary]
+
 def create_search_agent(llm: OpenAIChatCompletionsModel, mode: str):
     return Agent(
         name="Search Agent",
         instructions=SEARCH_AGENT_PROMPT,
         tools=[url_scrape],
         model=llm,
-    )
\ No newline at end of file
+    )
+
+def create_batch_search_agent(llm: OpenAIChatCompletionsModel, mode: str):
+    return Agent(
+        name="Batch Search Agent",
+        instructions=BATCH_SEARCH_AGENT_PROMPT,
+        output_type=BatchSummaryResponse,
+        model=llm,
+    )
@@ -11,10 +11,12 @@ import time
 import os
 from coordinator import ResearchCoordinator
 from research_agents.query_agent import create_query_agent
-from research_agents.search_agent import create_search_agent
+from research_agents.search_agent import create_search_agent, create_batch_search_agent
 from research_agents.follow_up_agent import create_follow_up_agent
 from research_agents.synthesis_agent import create_synthesis_agent
 from llm_config import LLMConfig, create_default_config
+from token_utils import get_context_limit
+from fetcher import PageFetcher
 
 load_dotenv()
 
@@ -62,6 +64,16 @@ config = {
     "DEFAULT_PROVIDER": os.getenv("DEFAULT_PROVIDER", "2"),
     "DEFAULT_MODE": os.getenv("DEFAULT_MODE", "1"),
     "DEFAULT_SEARCH_PROVIDER": os.getenv("DEFAULT_SEARCH_PROVIDER", "1"),
+    "BATCH_SUMMARIES": os.getenv("BATCH_SUMMARIES", "false").lower() in ["1", "true", "yes"],
+    "BATCH_TOKEN_BUDGET": int(os.getenv("BATCH_TOKEN_BUDGET", "12000")),
+    "CONTEXT_WINDOW": int(os.getenv("CONTEXT_WINDOW")) if os.getenv("CONTEXT_WINDOW") else None,
+    "NOVELTY_THRESHOLD": float(os.getenv("NOVELTY_THRESHOLD", "0.3")),
+    "FETCH_PER_HOST_LIMIT": int(os.getenv("FETCH_PER_HOST_LIMIT", "2")),
+    "FETCH_CONNECT_TIMEOUT": float(os.getenv("FETCH_CONNECT_TIMEOUT", "5")),
+    "FETCH_READ_TIMEOUT": float(os.getenv("FETCH_READ_TIMEOUT", "15")),
+    "RESPECT_ROBOTS_TXT": os.getenv("RESPECT_ROBOTS_TXT", "false").lower() in ["1", "true", "yes"],
+    "PIPELINED": os.getenv("PIPELINED", "true").lower() in ["1", "true", "yes"],
+    "TIME_BUDGET": float(os.getenv("TIME_BUDGET")) if os.getenv("TIME_BUDGET") else None,
 }
 
 # Validate required API keys for search providers
@@ -234,6 +246,7 @@ async def main() -> None:
         # Create agents
         query_agent = create_query_agent(llm_config.main_model)
         search_agent = create_search_agent(llm_config.main_model, mode)
+        batch_search_agent = create_batch_search_agent(llm_config.main_model, mode) if config["BATCH_SUMMARIES"] else None
         follow_up_agent = create_follow_up_agent(llm_config.main_model, mode)
         synthesis_agent = create_synthesis_agent(llm_config.main_model, mode)
 
@@ -248,7 +261,19 @@ async def main() -> None:
             mode,
             selected_search_provider,
             config["SERPER_API_KEY"],
-            config["BRAVE_API_KEY"]
+            config["BRAVE_API_KEY"],
+            batch_search_agent=batch_search_agent,
+            batch_token_budget=config["BATCH_TOKEN_BUDGET"],
+            context_limit=config["CONTEXT_WINDOW"] or get_context_limit(model_name),
+            time_budget=config["TIME_BUDGET"],
+            novelty_threshold=config["NOVELTY_THRESHOLD"],
+            fetcher=PageFetcher(
+                per_host_limit=config["FETCH_PER_HOST_LIMIT"],
+                connect_timeout=config["FETCH_CONNECT_TIMEOUT"],
+                read_timeout=config["FETCH_READ_TIMEOUT"],
+                respect_robots=config["RESPECT_ROBOTS_TXT"]
+            ),
+            pipelined=config["PIPELINED"]
         )
         console.print("[progress]Processing research...[/progress]")
         report = await coordinator.research()
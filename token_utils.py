@@ -0,0 +1,69 @@
+import re
+
+# Rough token estimates, good enough for budgeting prompts without a tokenizer dependency.
+CHARS_PER_TOKEN = 4
+
+# Context windows (in tokens) matched against model names; longer keys win over shorter ones
+MODEL_CONTEXT_LIMITS = {
+    "gpt-3.5-turbo": 16385,
+    "gpt-4": 8192,
+    "gpt-4-turbo": 128000,
+    "gpt-4o": 128000,
+    "gpt-4.1": 1000000,
+    "o1": 200000,
+    "o3": 200000,
+    "o4": 200000,
+    "claude": 200000,
+    "gemini-1.5-flash": 1000000,
+    "gemini-1.5-pro": 2000000,
+    "gemini-2": 1000000,
+    "grok-2": 131072,
+    "grok-3": 131072,
+    "mixtral-8x7b": 32768,
+    "mixtral-8x22b": 65536,
+    "mistral": 32768,
+    "deepseek": 65536,
+}
+DEFAULT_CONTEXT_LIMIT = 8192
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    return len(text) // CHARS_PER_TOKEN + 1
+
+def get_context_limit(model_name: str) -> int:
+    name = model_name.lower()
+    for key in sorted(MODEL_CONTEXT_LIMITS, key=len, reverse=True):
+        if key in name:
+            return MODEL_CONTEXT_LIMITS[key]
+    return DEFAULT_CONTEXT_LIMIT
+
+def compress_text(text: str, max_tokens: int) -> str:
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    # Collapse whitespace first, then trim at a sentence boundary if still too long
+    text = re.sub(r"\s+", " ", text).strip()
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    max_chars = max(max_tokens, 1) * CHARS_PER_TOKEN
+    trimmed = text[:max_chars]
+    sentence_end = trimmed.rfind(". ")
+    if sentence_end > max_chars // 2:
+        trimmed = trimmed[:sentence_end + 1]
+    return trimmed.rstrip() + " [...]"
+
+def pack_texts(texts: list[str], budget: int, item_overhead: int = 0) -> list[list[int]]:
+    # Greedily group consecutive texts so each group stays within the token budget;
+    # item_overhead charges every text for extra tokens it brings along (e.g. its share of the output)
+    groups = []
+    current, current_tokens = [], 0
+    for index, text in enumerate(texts):
+        tokens = estimate_tokens(text) + item_overhead
+        if current and current_tokens + tokens > budget:
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups